@@ -2,19 +2,86 @@
 OAuth2 authentication for MCP server access.
 """
 
+import atexit
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from typing import Optional
 
+# Shared keep-alive session for all token providers (and other HTTP calls),
+# built on first use
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(pool_size: int) -> requests.Session:
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    The session retries transient failures with exponential backoff. The
+    pool size of the first caller wins; later callers share that pool.
+
+    Args:
+        pool_size: Connection pool size, sized to the worker's concurrency
+
+    Returns:
+        requests.Session: Shared keep-alive session
+    """
+    global _SESSION
+
+    session = _SESSION
+    if session is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=pool_size,
+                        pool_maxsize=pool_size,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.3,
+                            backoff_jitter=0.3,
+                            status_forcelist=(429, 500, 502, 503, 504),
+                            allowed_methods=("POST",),
+                            raise_on_status=False,
+                        ),
+                    ),
+                )
+                _SESSION = session
+            session = _SESSION
+    return session
+
 
 class OAuth2TokenProvider:
     """
     Obtains and caches OAuth2 tokens from Spring Authorization Server.
 
-    Automatically refreshes tokens before expiration.
+    Tokens are refreshed in a background thread before they expire, so
+    callers of get_token() normally never wait on the token endpoint.
     """
 
-    def __init__(self, token_url: str, client_id: str, client_secret: str):
+    # Refresh this long before the cached expiry (or at 80% of remaining TTL)
+    REFRESH_AHEAD_SECONDS = 300
+    # Wait before retrying after a failed background refresh
+    RETRY_DELAY_SECONDS = 30
+    # Never refresh in the background more often than this
+    MIN_REFRESH_INTERVAL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str,
+        client_secret: str,
+        refresh_buffer_ratio: float = 0.1,
+        min_refresh_buffer_seconds: int = 30,
+        max_refresh_buffer_seconds: int = 300,
+        min_ttl_seconds: int = 30,
+        pool_size: int = 8,
+    ):
         """
         Initialize OAuth2 token provider.
 
@@ -22,12 +89,31 @@ class OAuth2TokenProvider:
             token_url: OAuth2 token endpoint URL
             client_id: OAuth2 client ID
             client_secret: OAuth2 client secret
+            refresh_buffer_ratio: Treat tokens as expired this fraction of
+                their lifetime before the server-reported expiry
+            min_refresh_buffer_seconds: Lower bound for the refresh buffer
+            max_refresh_buffer_seconds: Upper bound for the refresh buffer
+            min_ttl_seconds: Minimum time a fetched token is cached, so
+                short-lived tokens don't trigger a refresh on every call
+                (never more than half the server-reported lifetime)
+            pool_size: Connection pool size for the shared HTTP session
         """
         self.token_url = token_url
         self.client_id = client_id
         self.client_secret = client_secret
+        self.refresh_buffer_ratio = refresh_buffer_ratio
+        self.min_refresh_buffer_seconds = min_refresh_buffer_seconds
+        self.max_refresh_buffer_seconds = max_refresh_buffer_seconds
+        self.min_ttl_seconds = min_ttl_seconds
+        self.pool_size = pool_size
         self._token: Optional[str] = None
-        self._expires_at: Optional[datetime] = None
+        self._expires_at_monotonic: float = 0.0
+
+        # Serializes token fetches; also guards background thread start-up
+        # (the thread is started on first get_token)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
 
     def get_token(self) -> str:
         """
@@ -38,27 +124,101 @@ class OAuth2TokenProvider:
 
         Raises:
             requests.HTTPError: If token request fails
+            requests.exceptions.InvalidJSONError: If the token response is malformed
         """
-        # Return cached token if still valid
-        if self._token and self._expires_at and datetime.now() < self._expires_at:
-            return self._token
+        # Return cached token if still valid (re-checked in case the
+        # background refresh fell behind, e.g. after the process was suspended).
+        # Expiry is read before the token; _fetch writes them in reverse order.
+        expires_at = self._expires_at_monotonic
+        token = self._token
+        if not (token and time.monotonic() < expires_at):
+            with self._lock:
+                # Another thread may have refreshed while we waited
+                token = self._token
+                if not (token and time.monotonic() < self._expires_at_monotonic):
+                    token = self._fetch()
+
+        self._start_refresh_thread()
+        return token
 
-        # Request new token
-        response = requests.post(
+    def close(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        thread = self._refresh_thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _fetch(self) -> str:
+        """Request a new token and swap it into the cache. Caller holds self._lock."""
+        response = _get_session(self.pool_size).post(
             self.token_url,
             data={
                 "grant_type": "client_credentials",
                 "scope": "mcp:read mcp:write mcp:tools"
             },
             auth=(self.client_id, self.client_secret),
-            headers={"Content-Type": "application/x-www-form-urlencoded"}
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            timeout=(3, 10)
         )
         response.raise_for_status()
 
-        # Cache token with expiration (60 seconds buffer)
-        token_data = response.json()
-        self._token = token_data["access_token"]
-        expires_in = token_data.get("expires_in", 3600)
-        self._expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+        # Cache token with expiration: proportional refresh buffer, floored
+        # at min TTL but never past the token's real lifetime
+        try:
+            token_data = response.json()
+            token = token_data["access_token"]
+            expires_in = float(token_data.get("expires_in", 3600))
+            if expires_in <= 0:
+                raise ValueError(f"non-positive expires_in: {expires_in}")
+        except (KeyError, TypeError, ValueError) as e:
+            # Surface malformed responses as requests errors, like HTTP failures
+            raise requests.exceptions.InvalidJSONError(
+                f"Invalid token response from {self.token_url}: {e!r}", response=response
+            ) from e
+        buffer = max(
+            self.min_refresh_buffer_seconds,
+            min(self.max_refresh_buffer_seconds, expires_in * self.refresh_buffer_ratio),
+        )
+        ttl = max(min(self.min_ttl_seconds, expires_in / 2), expires_in - buffer)
+        self._token = token
+        self._expires_at_monotonic = time.monotonic() + ttl
+
+        return token
+
+    def _start_refresh_thread(self) -> None:
+        """Start the background refresh thread if it is not already running."""
+        if self._refresh_thread is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh_loop,
+                    name="oauth2-token-refresh",
+                    daemon=True,
+                )
+                self._refresh_thread.start()
+                # Stop the thread cleanly at interpreter shutdown
+                atexit.register(self.close)
+
+    def _refresh_loop(self) -> None:
+        """Sleep until shortly before expiry, then rotate the token."""
+        while not self._stop.is_set():
+            remaining = self._expires_at_monotonic - time.monotonic()
+            wait = max(
+                remaining - self.REFRESH_AHEAD_SECONDS,
+                remaining * 0.8,
+                self.MIN_REFRESH_INTERVAL_SECONDS,
+            )
+
+            if self._stop.wait(wait):
+                return
 
-        return self._token
+            try:
+                with self._lock:
+                    self._fetch()
+            except Exception as e:
+                # Keep the thread alive on any error; get_token() still
+                # fetches synchronously if the cached token expires meanwhile
+                print(f"Warning: Background OAuth2 token refresh failed: {e}")
+                if self._stop.wait(self.RETRY_DELAY_SECONDS):
+                    return
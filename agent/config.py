@@ -2,10 +2,10 @@
 Configuration management for the agent.
 """
 
+import functools
 import json
 import os
 from typing import NamedTuple, Optional
-from dotenv import load_dotenv
 
 
 class AgentConfig(NamedTuple):
@@ -15,12 +15,48 @@ class AgentConfig(NamedTuple):
     auth_server_token_url: str
     mcp_client_id: str
     mcp_client_secret: str
+    auth_pool_size: int = 8
+
+
+# Secrets Manager caches, one per region (built on first use)
+_SECRET_CACHES: dict = {}
+
+
+def _get_secret_cache(region: str):
+    """
+    Return the in-memory Secrets Manager cache for a region, creating it once.
+
+    Args:
+        region: AWS region
+
+    Returns:
+        SecretCache: Cache backed by a long-lived Secrets Manager client
+
+    Raises:
+        ImportError: If botocore or aws-secretsmanager-caching is not installed
+    """
+    cache = _SECRET_CACHES.get(region)
+    if cache is None:
+        import botocore.session
+        from botocore.config import Config
+        from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
+
+        client = botocore.session.get_session().create_client(
+            'secretsmanager',
+            region_name=region,
+            config=Config(retries={"max_attempts": 5, "mode": "adaptive"}),
+        )
+        cache = SecretCache(config=SecretCacheConfig(), client=client)
+        _SECRET_CACHES[region] = cache
+    return cache
 
 
 def _get_secret_from_aws(secret_name: str, region: str = "us-east-1") -> Optional[dict]:
     """
     Retrieve secret from AWS Secrets Manager.
 
+    Values are served from a client-side cache backed by a long-lived client.
+
     Args:
         secret_name: Name of the secret in Secrets Manager
         region: AWS region (default: us-east-1)
@@ -29,23 +65,32 @@ def _get_secret_from_aws(secret_name: str, region: str = "us-east-1") -> Optiona
         dict: Secret key-value pairs, or None if not available
     """
     try:
-        import boto3
         from botocore.exceptions import ClientError
 
-        client = boto3.client('secretsmanager', region_name=region)
-        response = client.get_secret_value(SecretId=secret_name)
-        return json.loads(response['SecretString'])
-    except (ImportError, ClientError, KeyError):
-        # boto3 not available, or secret not found, or IAM permissions missing
+        cache = _get_secret_cache(region)
+    except ImportError:
+        # botocore or aws-secretsmanager-caching not available (local dev)
+        return None
+
+    try:
+        return json.loads(cache.get_secret_string(secret_name))
+    except (ClientError, KeyError, TypeError, ValueError):
+        # Secret not found, IAM permissions missing, binary-only secret
+        # (no SecretString) or secret value is not valid JSON
         return None
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> AgentConfig:
     """
     Load configuration from environment variables or AWS Secrets Manager.
 
+    The result is cached, so .env parsing and Secrets Manager lookups
+    happen at most once per process.
+
     Local Development:
     - Loads from .env file via environment variables
+    - .env is skipped when SKIP_DOTENV, AWS_EXECUTION_ENV or SECRET_NAME is set
 
     AWS Deployment:
     - Loads OAuth2 credentials from Secrets Manager if SECRET_NAME is set
@@ -57,16 +102,27 @@ def load_config() -> AgentConfig:
     Raises:
         ValueError: If required environment variables are missing
     """
-    # Load .env file for local development (no-op if not present)
-    load_dotenv()
+    env = os.environ
+
+    # Load .env file for local development only; deployed runs already get
+    # their environment from the platform (no-op if not present)
+    if not (env.get("SKIP_DOTENV") or env.get("AWS_EXECUTION_ENV") or env.get("SECRET_NAME")):
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    # Snapshot environment once (load_dotenv updates os.environ in place)
+    secret_name = env.get("SECRET_NAME")
+    region = env.get("AWS_DEFAULT_REGION", "us-east-1")
+    finance_mcp_url = env.get("FINANCE_MCP_URL", "https://finance.macrospire.com/mcp")
+    auth_server_token_url = env.get("AUTH_SERVER_TOKEN_URL")
+    auth_pool_size = env.get("AUTH_POOL_SIZE", "8")
+    if not auth_pool_size.isdigit() or int(auth_pool_size) < 1:
+        raise ValueError(f"AUTH_POOL_SIZE must be a positive integer, got {auth_pool_size!r}")
 
     # Check if running in AWS with Secrets Manager
-    secret_name = os.getenv("SECRET_NAME")
     secret_data = None
-
     if secret_name:
         # Running in AWS - try to load from Secrets Manager
-        region = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
         secret_data = _get_secret_from_aws(secret_name, region)
 
     # Get OAuth2 credentials: Secrets Manager first, then environment variables
@@ -74,24 +130,29 @@ def load_config() -> AgentConfig:
         mcp_client_id = secret_data.get("MCP_CLIENT_ID")
         mcp_client_secret = secret_data.get("MCP_CLIENT_SECRET")
     else:
-        mcp_client_id = os.getenv("MCP_CLIENT_ID")
-        mcp_client_secret = os.getenv("MCP_CLIENT_SECRET")
+        mcp_client_id = env.get("MCP_CLIENT_ID")
+        mcp_client_secret = env.get("MCP_CLIENT_SECRET")
 
     # Build config
     config = AgentConfig(
         model_id="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
-        finance_mcp_url=os.getenv("FINANCE_MCP_URL", "https://finance.macrospire.com/mcp"),
-        auth_server_token_url=os.getenv("AUTH_SERVER_TOKEN_URL"),
+        finance_mcp_url=finance_mcp_url,
+        auth_server_token_url=auth_server_token_url,
         mcp_client_id=mcp_client_id,
         mcp_client_secret=mcp_client_secret,
+        auth_pool_size=int(auth_pool_size),
     )
 
-    # Validate required fields
-    if not config.auth_server_token_url:
-        raise ValueError("AUTH_SERVER_TOKEN_URL environment variable is required")
-    if not config.mcp_client_id:
-        raise ValueError("MCP_CLIENT_ID is required (from SECRET_NAME or environment)")
-    if not config.mcp_client_secret:
-        raise ValueError("MCP_CLIENT_SECRET is required (from SECRET_NAME or environment)")
+    # Validate required fields, reporting every missing one at once
+    missing = [
+        name for name, value in (
+            ("AUTH_SERVER_TOKEN_URL", config.auth_server_token_url),
+            ("MCP_CLIENT_ID", config.mcp_client_id),
+            ("MCP_CLIENT_SECRET", config.mcp_client_secret),
+        )
+        if not value
+    ]
+    if missing:
+        raise ValueError(f"Missing required config: {', '.join(missing)}")
 
     return config
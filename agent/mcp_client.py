@@ -2,37 +2,89 @@
 MCP client creation and management for Finance tools.
 """
 
+import threading
+from typing import Generator
+
+import httpx
 from strands.tools.mcp import MCPClient
 from mcp.client.streamable_http import streamablehttp_client
 
 from .auth import OAuth2TokenProvider
 from .config import AgentConfig
 
+# Token providers shared across invocations, keyed by (token_url, client_id)
+_PROVIDERS: dict[tuple[str, str], OAuth2TokenProvider] = {}
+_PROVIDER_LOCK = threading.Lock()
+
+
+def _get_or_create_provider(config: AgentConfig) -> OAuth2TokenProvider:
+    """
+    Return the cached OAuth2 token provider for this config, creating it once.
+
+    Args:
+        config: Agent configuration containing OAuth2 credentials
+
+    Returns:
+        OAuth2TokenProvider: Long-lived provider with its token cache and session
+    """
+    key = (config.auth_server_token_url, config.mcp_client_id)
+    provider = _PROVIDERS.get(key)
+    if provider is None:
+        with _PROVIDER_LOCK:
+            provider = _PROVIDERS.get(key)
+            if provider is None:
+                provider = OAuth2TokenProvider(
+                    token_url=config.auth_server_token_url,
+                    client_id=config.mcp_client_id,
+                    client_secret=config.mcp_client_secret,
+                    pool_size=config.auth_pool_size
+                )
+                _PROVIDERS[key] = provider
+    return provider
+
+
+class _BearerTokenAuth(httpx.Auth):
+    """
+    httpx auth that sets a fresh OAuth2 bearer token on every request.
+
+    The MCP transport keeps one HTTP client open for the life of the
+    connection, so a header fixed at connect time would outlive the token.
+    """
+
+    def __init__(self, token_provider: OAuth2TokenProvider):
+        self._token_provider = token_provider
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        # Normally served from the provider's cache (kept warm in the background)
+        request.headers["Authorization"] = f"Bearer {self._token_provider.get_token()}"
+        yield request
+
 
 def create_finance_client(config: AgentConfig) -> MCPClient:
     """
     Create an MCP client for Finance tools with OAuth2 authentication.
 
+    The bearer token is read from the shared token provider on every HTTP
+    request, so a single open client keeps working across token
+    refreshes and can be kept for the process lifetime. The client does
+    not reconnect by itself; callers close and recreate it on connection
+    errors.
+
     Args:
         config: Agent configuration containing MCP server details
 
     Returns:
         MCPClient: Configured MCP client for Finance server
     """
-    # Initialize OAuth2 token provider
-    token_provider = OAuth2TokenProvider(
-        token_url=config.auth_server_token_url,
-        client_id=config.mcp_client_id,
-        client_secret=config.mcp_client_secret
-    )
+    # Reuse the process-wide OAuth2 token provider
+    token_provider = _get_or_create_provider(config)
 
-    # Get OAuth2 token
-    token = token_provider.get_token()
+    # Fetch the token up front so auth failures surface here
+    token_provider.get_token()
 
-    # Create MCP client with Authorization header
+    # Create MCP client; the bearer token is set per request so a
+    # long-lived connection keeps using the current token
+    auth = _BearerTokenAuth(token_provider)
     return MCPClient(
-        lambda: streamablehttp_client(
-            config.finance_mcp_url,
-            headers={"Authorization": f"Bearer {token}"}
-        )
+        lambda: streamablehttp_client(config.finance_mcp_url, auth=auth)
     )
@@ -6,10 +6,22 @@ production Finance MCP server for real-time financial data and
 file system operations for code generation.
 """
 
+import atexit
+import threading
+import time
+from collections import deque
+from contextlib import ExitStack
+from typing import Optional
+
+import httpx
+import requests
 from bedrock_agentcore import BedrockAgentCoreApp
+from mcp.shared.exceptions import McpError
 from strands import Agent
+from strands.hooks import AfterToolCallEvent, HookProvider, HookRegistry
 from strands.models import BedrockModel
-from strands_tools import file_read, file_write, editor
+from strands.tools.mcp import MCPAgentTool, MCPClient
+from strands.types.exceptions import MCPClientInitializationError
 
 from agent import create_finance_client, load_config
 
@@ -23,6 +35,225 @@ config = load_config()
 # This routes requests across US regions (us-east-1, us-east-2, us-west-2)
 model = BedrockModel(model_id=config.model_id)
 
+# System prompts for the Finance MCP agent and the file-tools-only fallback
+_SYSTEM_PROMPT_WITH_MCP = """You are a helpful AI assistant powered by Claude Sonnet 4.5.
+
+You have access to financial market data tools including:
+- Stock prices and market data
+- Earnings reports and analyst estimates
+- Treasury yields and economic indicators
+- Analyst upgrades and downgrades
+
+You also have file system tools for code generation:
+- file_read: Read files, list directories, search for files
+- file_write: Create new files or overwrite existing files
+- editor: Edit existing files using search and replace
+
+Use these tools to provide accurate financial information and assist with code generation tasks."""
+
+_SYSTEM_PROMPT_FALLBACK = """You are a helpful AI assistant powered by Claude Sonnet 4.5.
+
+You have file system tools for code generation:
+- file_read: Read files, list directories, search for files
+- file_write: Create new files or overwrite existing files
+- editor: Edit existing files using search and replace
+
+Use these tools to assist with code generation and file management tasks."""
+
+# Finance MCP connection, opened on first use and shared by all invocations.
+# Agents themselves are built per invoke so conversations never leak
+# between requests and concurrent invokes never share message history.
+_init_lock = threading.Lock()
+_exit_stack: Optional[ExitStack] = None
+_finance_client: Optional[MCPClient] = None
+
+# MCP tool lists keyed by server URL: (monotonic fetch time, tools)
+_TOOLS_TTL_SECONDS = 600
+_TOOLS_CACHE: dict[str, tuple[float, list]] = {}
+
+
+def _cached_tools() -> Optional[list]:
+    """Return the cached Finance MCP tool list if it is within its TTL."""
+    cached = _TOOLS_CACHE.get(config.finance_mcp_url)
+    if cached is not None and time.monotonic() - cached[0] < _TOOLS_TTL_SECONDS:
+        return cached[1]
+    return None
+
+
+def _get_finance_tools() -> list:
+    """
+    Return the Finance MCP tools, opening the shared connection on first use.
+
+    The MCP connection is held open in a module-level ExitStack so it
+    outlives individual invocations. Once the cached tool list expires it
+    is re-fetched over the open connection by a single thread; agents
+    already running keep the list they were built with.
+
+    Returns:
+        list: MCP tools bound to the shared client
+    """
+    global _exit_stack, _finance_client
+
+    mcp_tools = _cached_tools()
+    if _finance_client is not None and mcp_tools is not None:
+        return mcp_tools
+
+    with _init_lock:
+        if _finance_client is None:
+            stack = ExitStack()
+            try:
+                # Keep MCP connection open for the lifetime of the process
+                client = stack.enter_context(create_finance_client(config))
+            except Exception:
+                stack.close()
+                raise
+
+            _exit_stack = stack
+            _finance_client = client
+
+        # Another thread may have refreshed the list while we waited
+        mcp_tools = _cached_tools()
+        if mcp_tools is None:
+            try:
+                mcp_tools = _finance_client.list_tools_sync()
+            except Exception:
+                # Connection is unusable; the next caller reconnects
+                _close_finance_client_locked()
+                raise
+            _TOOLS_CACHE[config.finance_mcp_url] = (time.monotonic(), mcp_tools)
+
+    return mcp_tools
+
+
+# strands' MCPClient turns transport/session exceptions during a tool call
+# into an error result with this text prefix instead of raising
+_MCP_EXECUTION_FAILED_PREFIX = "Tool execution failed:"
+
+
+class _McpToolErrorHook(HookProvider):
+    """Records Finance MCP tool failures during one agent run."""
+
+    def __init__(self):
+        self.tool_failed = False
+        self.failed_client: Optional[MCPClient] = None
+
+    def register_hooks(self, registry: HookRegistry, **kwargs) -> None:
+        registry.add_callback(AfterToolCallEvent, self._after_tool_call)
+
+    def _after_tool_call(self, event: AfterToolCallEvent) -> None:
+        tool = event.selected_tool
+        if not isinstance(tool, MCPAgentTool) or event.result.get("status") != "error":
+            return
+
+        self.tool_failed = True
+        # Execution failures (as opposed to errors reported by the server)
+        # mean the connection itself is unusable
+        if any(
+            content.get("text", "").startswith(_MCP_EXECUTION_FAILED_PREFIX)
+            for content in event.result.get("content", [])
+        ):
+            self.failed_client = tool.mcp_client
+
+
+def _build_agent(mcp_tools: list, tool_errors: _McpToolErrorHook) -> Agent:
+    """
+    Create a fresh agent with finance and file tools for one invocation.
+
+    Args:
+        mcp_tools: Tools from the Finance MCP server
+        tool_errors: Hook recording MCP tool failures during the run
+
+    Returns:
+        Agent: Agent configured with finance and file tools
+    """
+    from strands_tools import file_read, file_write, editor
+
+    # Combine MCP tools with file system tools
+    all_tools = mcp_tools + [file_read, file_write, editor]
+
+    return Agent(
+        model=model,
+        tools=all_tools,
+        system_prompt=_SYSTEM_PROMPT_WITH_MCP,
+        hooks=[tool_errors]
+    )
+
+
+def _reset_finance_client(expected: Optional[MCPClient] = None) -> None:
+    """
+    Close the MCP connection and invalidate the cached tool list so the
+    next invoke reconnects.
+
+    Args:
+        expected: Only reset if this is still the current client, so a stale
+            failure does not close a connection another invoke just opened
+    """
+    with _init_lock:
+        if expected is not None and _finance_client is not expected:
+            return
+        _close_finance_client_locked()
+
+
+def _close_finance_client_locked() -> None:
+    """Close the MCP connection and drop the cached tool list. Caller holds _init_lock."""
+    global _exit_stack, _finance_client
+
+    stack = _exit_stack
+    _exit_stack = None
+    _finance_client = None
+    _TOOLS_CACHE.pop(config.finance_mcp_url, None)
+    if stack is not None:
+        try:
+            stack.close()
+        except Exception as e:
+            print(f"Warning: Error closing Finance MCP connection: {e}")
+
+
+atexit.register(_reset_finance_client)
+
+
+# Errors that mean the Finance MCP server (or its auth server) is unreachable
+_MCP_CONNECTION_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    httpx.HTTPError,
+    requests.RequestException,
+    McpError,
+    MCPClientInitializationError,
+)
+
+# Circuit breaker: after this many MCP failures within the window, skip
+# MCP entirely until the oldest failure leaves the window
+_MCP_FAILURE_THRESHOLD = 3
+_MCP_FAILURE_WINDOW_SECONDS = 60
+_mcp_failures: deque[float] = deque(maxlen=_MCP_FAILURE_THRESHOLD)
+
+
+def _mcp_circuit_open() -> bool:
+    """Return True if recent MCP failures mean we should not try to connect."""
+    # Snapshot first: other invoke threads may append to or clear the deque
+    failures = tuple(_mcp_failures)
+    return (
+        len(failures) == _MCP_FAILURE_THRESHOLD
+        and time.monotonic() - failures[0] < _MCP_FAILURE_WINDOW_SECONDS
+    )
+
+
+def _build_fallback_agent() -> Agent:
+    """
+    Create a fresh agent with only file tools for one invocation.
+
+    Returns:
+        Agent: Agent configured with file tools
+    """
+    from strands_tools import file_read, file_write, editor
+
+    return Agent(
+        model=model,
+        tools=[file_read, file_write, editor],
+        system_prompt=_SYSTEM_PROMPT_FALLBACK
+    )
+
 
 @app.entrypoint
 def invoke(payload: dict) -> dict:
@@ -37,59 +268,54 @@ def invoke(payload: dict) -> dict:
     """
     user_message = payload.get("prompt", "Hello! How can I help you today?")
 
-    # Try to use Finance MCP tools
-    try:
-        finance_client = create_finance_client(config)
-
-        # Keep MCP connection open during agent execution
-        with finance_client:
-            # Get tools from MCP server
-            mcp_tools = finance_client.list_tools_sync()
+    # Get Finance MCP tools unless MCP has been failing repeatedly. Only
+    # connecting and listing tools can trigger the fallback; errors during
+    # the agent run itself propagate.
+    mcp_tools = None
+    if not _mcp_circuit_open():
+        try:
+            mcp_tools = _get_finance_tools()
+        except _MCP_CONNECTION_ERRORS as e:
+            print(f"Warning: Could not connect to Finance MCP server: {e}")
+            _mcp_failures.append(time.monotonic())
 
-            # Combine MCP tools with file system tools
-            all_tools = mcp_tools + [file_read, file_write, editor]
+    if mcp_tools is None:
+        # Fallback to agent with only file tools if MCP connection fails
+        result = _build_fallback_agent()(user_message)
+        return {"result": result.message}
 
-            # Create agent with finance and file tools
-            agent = Agent(
-                model=model,
-                tools=all_tools,
-                system_prompt="""You are a helpful AI assistant powered by Claude Sonnet 4.5.
+    tool_errors = _McpToolErrorHook()
+    result = _build_agent(mcp_tools, tool_errors)(user_message)
 
-You have access to financial market data tools including:
-- Stock prices and market data
-- Earnings reports and analyst estimates
-- Treasury yields and economic indicators
-- Analyst upgrades and downgrades
-
-You also have file system tools for code generation:
-- file_read: Read files, list directories, search for files
-- file_write: Create new files or overwrite existing files
-- editor: Edit existing files using search and replace
+    if tool_errors.tool_failed:
+        # Re-list tools on the next invoke
+        _TOOLS_CACHE.pop(config.finance_mcp_url, None)
+    if tool_errors.failed_client is not None:
+        print("Warning: Finance MCP tool call failed, reconnecting on next invoke")
+        _mcp_failures.append(time.monotonic())
+        _reset_finance_client(tool_errors.failed_client)
+    else:
+        _mcp_failures.clear()
+    return {"result": result.message}
 
-Use these tools to provide accurate financial information and assist with code generation tasks."""
-            )
 
-            # Execute agent query while MCP connection is still open
-            result = agent(user_message)
-            return {"result": result.message}
+def _warm_up() -> None:
+    """
+    Fetch the OAuth2 token, connect to the Finance MCP server and list its
+    tools at container start, so the first invoke hits warm caches.
 
+    Warm-up is best-effort: any failure is logged and left for the first
+    invoke to retry, so a boot-time outage never crashes the container.
+    """
+    try:
+        _get_finance_tools()
     except Exception as e:
-        # Fallback to agent with only file tools if MCP connection fails
-        print(f"Warning: Could not connect to Finance MCP server: {e}")
-        agent = Agent(
-            model=model,
-            tools=[file_read, file_write, editor],
-            system_prompt="""You are a helpful AI assistant powered by Claude Sonnet 4.5.
+        print(f"Warning: Finance MCP warm-up failed, will retry on first invoke: {e}")
 
-You have file system tools for code generation:
-- file_read: Read files, list directories, search for files
-- file_write: Create new files or overwrite existing files
-- editor: Edit existing files using search and replace
 
-Use these tools to assist with code generation and file management tasks."""
-        )
-        result = agent(user_message)
-        return {"result": result.message}
+# Warm up in the background so importing this module never blocks on the
+# network; an invoke arriving meanwhile waits on _init_lock
+threading.Thread(target=_warm_up, name="finance-mcp-warm-up", daemon=True).start()
 
 
 if __name__ == "__main__":
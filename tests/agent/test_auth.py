@@ -0,0 +1,125 @@
+"""
+Tests for OAuth2TokenProvider (token endpoint mocked).
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from agent import auth
+from agent.auth import OAuth2TokenProvider
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    """Returns queued responses (or raises queued exceptions) and counts POSTs."""
+
+    def __init__(self, *results, delay=0.0):
+        self._results = list(results)
+        self._delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, **kwargs):
+        time.sleep(self._delay)
+        with self._lock:
+            self.calls += 1
+            result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        if isinstance(result, Exception):
+            raise result
+        return FakeResponse(result)
+
+
+@pytest.fixture
+def make_provider(monkeypatch):
+    """Build providers backed by a FakeSession; stop their threads afterwards."""
+    providers = []
+
+    def _make(session):
+        monkeypatch.setattr(auth, "_get_session", lambda pool_size: session)
+        provider = OAuth2TokenProvider("https://auth.example.com/token", "id", "secret")
+        providers.append(provider)
+        return provider
+
+    yield _make
+    for provider in providers:
+        provider.close()
+
+
+def test_concurrent_stale_get_token_issues_one_post(make_provider):
+    session = FakeSession({"access_token": "t1", "expires_in": 3600}, delay=0.2)
+    provider = make_provider(session)
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(provider.get_token())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tokens == ["t1"] * 10
+    assert session.calls == 1
+
+
+@pytest.mark.parametrize(
+    ("expires_in", "expected_ttl"),
+    [
+        (10, 5),  # min TTL floor capped at half the lifetime
+        (60, 30),  # 30s minimum buffer
+        (3600, 3300),  # 10% buffer, capped at 300s
+    ],
+)
+def test_cached_ttl(make_provider, expires_in, expected_ttl):
+    provider = make_provider(FakeSession({"access_token": "t", "expires_in": expires_in}))
+
+    provider.get_token()
+
+    ttl = provider._expires_at_monotonic - time.monotonic()
+    assert expected_ttl - 1 < ttl <= expected_ttl
+
+
+@pytest.mark.parametrize("payload", [
+    {"access_token": "t", "expires_in": 0},
+    {"access_token": "t", "expires_in": "soon"},
+    {"expires_in": 3600},
+])
+def test_malformed_token_response_raises_request_exception(make_provider, payload):
+    provider = make_provider(FakeSession(payload))
+
+    with pytest.raises(requests.exceptions.InvalidJSONError):
+        provider.get_token()
+
+
+def test_refresh_loop_retries_after_unexpected_error(make_provider):
+    session = FakeSession(
+        {"access_token": "t1", "expires_in": 1},
+        RuntimeError("boom"),
+        {"access_token": "t2", "expires_in": 3600},
+    )
+    provider = make_provider(session)
+    provider.RETRY_DELAY_SECONDS = 0.01
+    provider.MIN_REFRESH_INTERVAL_SECONDS = 0.01
+
+    assert provider.get_token() == "t1"
+
+    deadline = time.monotonic() + 5
+    while provider._token != "t2" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert provider._token == "t2"
+    assert session.calls == 3
+    assert provider._refresh_thread.is_alive()
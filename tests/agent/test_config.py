@@ -0,0 +1,60 @@
+"""
+Tests for load_config (environment only, no .env or AWS).
+"""
+
+import pytest
+
+from agent.config import load_config
+
+_CONFIG_VARS = (
+    "AUTH_SERVER_TOKEN_URL",
+    "MCP_CLIENT_ID",
+    "MCP_CLIENT_SECRET",
+    "FINANCE_MCP_URL",
+    "SECRET_NAME",
+    "AUTH_POOL_SIZE",
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in _CONFIG_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("SKIP_DOTENV", "1")
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+def test_reports_all_missing_fields():
+    with pytest.raises(ValueError) as exc_info:
+        load_config()
+
+    assert str(exc_info.value) == (
+        "Missing required config: AUTH_SERVER_TOKEN_URL, MCP_CLIENT_ID, MCP_CLIENT_SECRET"
+    )
+
+
+def test_loads_and_caches_config(monkeypatch):
+    monkeypatch.setenv("AUTH_SERVER_TOKEN_URL", "https://auth.example.com/token")
+    monkeypatch.setenv("MCP_CLIENT_ID", "id")
+    monkeypatch.setenv("MCP_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("AUTH_POOL_SIZE", "16")
+
+    config = load_config()
+
+    assert config.mcp_client_id == "id"
+    assert config.auth_pool_size == 16
+    assert config.finance_mcp_url == "https://finance.macrospire.com/mcp"
+    assert load_config() is config
+
+
+@pytest.mark.parametrize("value", ["abc", "0", "-1"])
+def test_rejects_invalid_pool_size(monkeypatch, value):
+    monkeypatch.setenv("AUTH_SERVER_TOKEN_URL", "https://auth.example.com/token")
+    monkeypatch.setenv("MCP_CLIENT_ID", "id")
+    monkeypatch.setenv("MCP_CLIENT_SECRET", "secret")
+    monkeypatch.setenv("AUTH_POOL_SIZE", value)
+
+    with pytest.raises(ValueError, match="AUTH_POOL_SIZE"):
+        load_config()
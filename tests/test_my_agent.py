@@ -0,0 +1,114 @@
+"""
+Tests for the invoke entrypoint's MCP fallback, circuit breaker and tool-failure handling.
+"""
+
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from mcp.types import Tool
+from strands.hooks import AfterToolCallEvent
+from strands.tools.mcp import MCPAgentTool
+
+
+@pytest.fixture(scope="module")
+def my_agent():
+    """Import my_agent with dummy config and an unreachable Finance MCP server."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SKIP_DOTENV", "1")
+        mp.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        mp.setenv("AUTH_SERVER_TOKEN_URL", "https://auth.example.com/token")
+        mp.setenv("MCP_CLIENT_ID", "id")
+        mp.setenv("MCP_CLIENT_SECRET", "secret")
+        mp.setattr("agent.create_finance_client", mock.Mock(side_effect=ConnectionError("offline")))
+
+        import agent
+        agent.load_config.cache_clear()
+        import my_agent
+
+        for thread in threading.enumerate():
+            if thread.name == "finance-mcp-warm-up":
+                thread.join()
+        yield my_agent
+
+
+class FakeAgent:
+    """Callable stand-in for a strands Agent."""
+
+    def __init__(self, side_effect=None):
+        self.side_effect = side_effect
+        self.calls = 0
+
+    def __call__(self, prompt):
+        self.calls += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return SimpleNamespace(message=f"echo: {prompt}")
+
+
+@pytest.fixture(autouse=True)
+def reset_state(my_agent):
+    my_agent._mcp_failures.clear()
+    my_agent._TOOLS_CACHE.clear()
+    yield
+    my_agent._mcp_failures.clear()
+    my_agent._TOOLS_CACHE.clear()
+
+
+def test_circuit_opens_after_repeated_connection_failures(my_agent, monkeypatch):
+    get_tools = mock.Mock(side_effect=ConnectionError("offline"))
+    fallback = FakeAgent()
+    monkeypatch.setattr(my_agent, "_get_finance_tools", get_tools)
+    monkeypatch.setattr(my_agent, "_build_fallback_agent", lambda: fallback)
+
+    for _ in range(my_agent._MCP_FAILURE_THRESHOLD):
+        assert my_agent.invoke({"prompt": "hi"}) == {"result": "echo: hi"}
+    assert get_tools.call_count == my_agent._MCP_FAILURE_THRESHOLD
+    assert my_agent._mcp_circuit_open()
+
+    my_agent.invoke({"prompt": "hi"})
+
+    assert get_tools.call_count == my_agent._MCP_FAILURE_THRESHOLD
+    assert fallback.calls == my_agent._MCP_FAILURE_THRESHOLD + 1
+
+
+def test_circuit_closed_without_failures(my_agent):
+    assert not my_agent._mcp_circuit_open()
+
+
+def test_agent_run_errors_propagate(my_agent, monkeypatch):
+    fallback = FakeAgent()
+    monkeypatch.setattr(my_agent, "_get_finance_tools", lambda: [])
+    monkeypatch.setattr(my_agent, "_build_agent", lambda tools, hook: FakeAgent(RuntimeError("model error")))
+    monkeypatch.setattr(my_agent, "_build_fallback_agent", lambda: fallback)
+
+    with pytest.raises(RuntimeError, match="model error"):
+        my_agent.invoke({"prompt": "hi"})
+
+    assert fallback.calls == 0
+    assert not my_agent._mcp_failures
+
+
+@pytest.mark.parametrize(
+    ("text", "connection_failed"),
+    [
+        ("Tool execution failed: connection closed", True),
+        ("Unknown ticker", False),
+    ],
+)
+def test_tool_error_hook(my_agent, text, connection_failed):
+    client = object()
+    tool = MCPAgentTool(Tool(name="quote", inputSchema={"type": "object"}), client)
+    hook = my_agent._McpToolErrorHook()
+
+    hook._after_tool_call(AfterToolCallEvent(
+        agent=None,
+        selected_tool=tool,
+        tool_use={"toolUseId": "1", "name": "quote", "input": {}},
+        invocation_state={},
+        result={"toolUseId": "1", "status": "error", "content": [{"text": text}]},
+    ))
+
+    assert hook.tool_failed
+    assert hook.failed_client is (client if connection_failed else None)